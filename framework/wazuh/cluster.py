@@ -5,6 +5,7 @@
 from typing import Union
 
 from wazuh.core import common
+from wazuh.core.common import fast_sync
 from wazuh.core.cluster import local_client
 from wazuh.core.cluster.cluster import get_node
 from wazuh.core.cluster.control import get_health, get_nodes, get_node_ruleset_integrity
@@ -18,6 +19,7 @@ node_id = get_node().get('node') if cluster_enabled else None
 
 
 @expose_resources(actions=['cluster:read'], resources=[f'node:id:{node_id}'])
+@fast_sync
 def read_config_wrapper() -> AffectedItemsWazuhResult:
     """Wrapper for read_config.
 
@@ -39,6 +41,7 @@ def read_config_wrapper() -> AffectedItemsWazuhResult:
 
 
 @expose_resources(actions=['cluster:read'], resources=[f'node:id:{node_id}'])
+@fast_sync
 def get_node_wrapper() -> AffectedItemsWazuhResult:
     """Wrapper for get_node.
 
@@ -60,6 +63,7 @@ def get_node_wrapper() -> AffectedItemsWazuhResult:
 
 
 @expose_resources(actions=['cluster:status'], resources=['*:*:*'], post_proc_func=None)
+@fast_sync
 def get_status_json() -> WazuhResult:
     """Return the cluster status.
 
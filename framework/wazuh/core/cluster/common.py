@@ -20,6 +20,7 @@ from typing import Tuple, Dict, Callable, List, Iterable, Union, Any
 from uuid import uuid4
 
 import cryptography.fernet
+import orjson
 
 import wazuh.core.results as wresults
 from wazuh import Wazuh
@@ -29,6 +30,8 @@ from wazuh.core.cluster import cluster, utils as cluster_utils
 from wazuh.core.wdb import AsyncWazuhDBConnection
 
 IGNORED_WDB_EXCEPTIONS = ['Cannot execute Global database query; FOREIGN KEY constraint failed']
+# Datetimes and dataclasses must reach WazuhJSONEncoder.default instead of being serialized natively by orjson
+WAZUH_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
 
 class Response:
     """
@@ -1778,6 +1781,31 @@ class WazuhJSONEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
+_wazuh_json_encoder = WazuhJSONEncoder()
+
+
+def wazuh_json_dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes following the WazuhJSONEncoder rules.
+
+    orjson is used to encode the object, falling back to the standard json module for the objects orjson cannot
+    represent (e.g. integers bigger than 64 bits or strings that are not valid UTF-8).
+
+    Parameters
+    ----------
+    obj : any
+        Object to serialize.
+
+    Returns
+    -------
+    bytes
+        JSON document encoded as UTF-8.
+    """
+    try:
+        return orjson.dumps(obj, default=_wazuh_json_encoder.default, option=WAZUH_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, cls=WazuhJSONEncoder).encode()
+
+
 def as_wazuh_object(dct: Dict):
     try:
         if '__callable__' in dct:
@@ -1814,3 +1842,25 @@ def as_wazuh_object(dct: Dict):
         raise exception.WazuhInternalError(1000,
                                            extra_message=f"Wazuh object cannot be decoded from JSON {dct}",
                                            cmd_error=True)
+
+
+def wazuh_json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document rebuilding the objects encoded by WazuhJSONEncoder.
+
+    Every object encoded by WazuhJSONEncoder is a dictionary whose key starts with '__'. Documents without any key
+    like that are decoded without calling `as_wazuh_object` for each dictionary.
+
+    Parameters
+    ----------
+    data : str or bytes
+        JSON document.
+
+    Returns
+    -------
+    any
+        Deserialized object.
+    """
+    if ('"__' if isinstance(data, str) else b'"__') not in data:
+        return json.loads(data)
+
+    return json.loads(data, object_hook=as_wazuh_object)
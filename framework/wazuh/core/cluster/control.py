@@ -4,6 +4,8 @@
 
 import json
 
+from cachetools import TTLCache
+
 from wazuh import WazuhInternalError
 from wazuh.core import common
 from wazuh.core.agent import Agent
@@ -12,6 +14,9 @@ from wazuh.core.cluster.common import as_wazuh_object, WazuhJSONEncoder
 from wazuh.core.exception import WazuhError
 from wazuh.core.utils import filter_array_by_query
 
+# Cluster node names only change when a worker connects or disconnects, and that happens in another process
+system_nodes_cache = TTLCache(maxsize=1, ttl=1)
+
 
 async def get_nodes(lc: local_client.LocalClient, filter_node=None, offset=0, limit=common.DATABASE_LIMIT,
                     sort=None, search=None, select=None, filter_type='all', q='', distinct: bool = False):
@@ -176,10 +181,16 @@ async def get_system_nodes():
     list
         Name of each cluster node.
     """
+    try:
+        return list(system_nodes_cache['nodes'])
+    except KeyError:
+        pass
+
     try:
         lc = local_client.LocalClient()
         result = await get_nodes(lc)
-        return [node['name'] for node in result['items']]
+        nodes = system_nodes_cache['nodes'] = [node['name'] for node in result['items']]
+        return list(nodes)
     except WazuhInternalError as e:
         if e.code == 3012:
             return WazuhError(3013)
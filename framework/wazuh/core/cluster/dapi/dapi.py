@@ -4,6 +4,8 @@
 
 import asyncio
 import contextlib
+import contextvars
+import inspect
 import itertools
 import json
 import logging
@@ -15,7 +17,7 @@ from concurrent.futures import process
 from copy import copy, deepcopy
 from functools import reduce, partial
 from operator import or_
-from typing import Callable, Dict, Tuple, List
+from typing import Callable, Dict, Tuple, List, Optional
 
 from sqlalchemy.exc import OperationalError
 
@@ -36,6 +38,42 @@ pools = common.mp_pools.get()
 
 authentication_funcs = {'check_token', 'check_user_master', 'get_permissions', 'get_security_conf'}
 events_funcs = {"send_event_to_analysisd"}
+NOT_READY_STATUS = frozenset({'failed', 'restarting', 'stopped'})
+
+
+log_filenames = {}
+
+
+def get_log_filename(logger: logging.Logger) -> Optional[str]:
+    """Get the path, relative to the Wazuh installation, of the file the logger writes to.
+
+    Only found paths are cached, so a file handler attached to the logger later is still picked up.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        Logger whose handlers are inspected. Its parent handlers are used if it has none.
+
+    Returns
+    -------
+    str or None
+        Log file path starting with 'WAZUH_HOME' or None if no handler writes to a file.
+    """
+    try:
+        return log_filenames[logger]
+    except KeyError:
+        pass
+
+    log_filename = None
+    for h in logger.handlers or logger.parent.handlers:
+        if hasattr(h, 'baseFilename'):
+            log_filename = os.path.join('WAZUH_HOME', os.path.relpath(h.baseFilename, start=common.WAZUH_PATH))
+
+    if log_filename is not None:
+        log_filenames[logger] = log_filename
+
+    return log_filename
+
 
 class DistributedAPI:
     """Represents a distributed API request."""
@@ -92,6 +130,7 @@ class DistributedAPI:
         self.cluster_items = wazuh.core.cluster.utils.get_cluster_items() if node is None else node.cluster_items
         self.debug = debug
         self.node_info = wazuh.core.cluster.cluster.get_node() if node is None else node.get_node()
+        self.is_cluster_disabled = None
         self.request_type = request_type
         self.wait_for_complete = wait_for_complete
         self.from_cluster = from_cluster
@@ -135,31 +174,38 @@ class DistributedAPI:
             Dictionary with API response or WazuhException in case of error.
         """
         try:
-            if 'password' in self.f_kwargs:
-                self.debug_log(f"Receiving parameters { {**self.f_kwargs, 'password': '****'} }")
-            elif 'token_nbf_time' in self.f_kwargs:
-                self.logger.debug(f"Decoded token {self.f_kwargs}")
+            f_kwargs = self.f_kwargs
+            request_type = self.request_type
+            is_master = self.node_info['type'] == 'master'
+
+            if 'password' in f_kwargs:
+                self.debug_log(f"Receiving parameters { {**f_kwargs, 'password': '****'} }")
+            elif 'token_nbf_time' in f_kwargs:
+                self.logger.debug(f"Decoded token {f_kwargs}")
             else:
-                self.debug_log(f"Receiving parameters {self.f_kwargs}")
+                self.debug_log(f"Receiving parameters {f_kwargs}")
 
             is_dapi_enabled = self.cluster_items['distributed_api']['enabled']
-            is_cluster_disabled = self.node == local_client and not check_cluster_status()
+            # Forwarded requests run this method again for the local node, reuse the first check
+            if self.is_cluster_disabled is None:
+                self.is_cluster_disabled = self.node == local_client and not check_cluster_status()
+            is_cluster_disabled = self.is_cluster_disabled
 
             # First case: execute the request locally.
             # If the distributed api is not enabled
             # If the cluster is disabled or the request type is local_any
             # if the request was made in the master node and the request type is local_master
             # if the request came forwarded from the master node and its type is distributed_master
-            if not is_dapi_enabled or is_cluster_disabled or self.request_type == 'local_any' or \
-                    (self.request_type == 'local_master' and self.node_info['type'] == 'master') or \
-                    (self.request_type == 'distributed_master' and self.from_cluster):
+            if not is_dapi_enabled or is_cluster_disabled or request_type == 'local_any' or \
+                    (request_type == 'local_master' and is_master) or \
+                    (request_type == 'distributed_master' and self.from_cluster):
 
                 response = await self.execute_local_request()
 
             # Second case: forward the request
             # Only the master node will forward a request, and it will only be forwarded if its type is distributed_
             # master
-            elif self.request_type == 'distributed_master' and self.node_info['type'] == 'master':
+            elif request_type == 'distributed_master' and is_master:
                 response = await self.forward_request()
 
             # Last case: execute the request remotely.
@@ -167,11 +213,12 @@ class DistributedAPI:
             else:
                 response = await self.execute_remote_request()
 
-            try:
-                response = json.loads(response, object_hook=c_common.as_wazuh_object) \
-                    if isinstance(response, str) else response
-            except json.decoder.JSONDecodeError:
-                response = {'message': response}
+            # Every branch returns decoded objects, only framework functions returning raw strings get here
+            if isinstance(response, str):
+                try:
+                    response = c_common.wazuh_json_loads(response)
+                except json.decoder.JSONDecodeError:
+                    response = {'message': response}
 
             return response if isinstance(response, (wresults.AbstractWazuhResult, exception.WazuhException)) \
                 else wresults.WazuhResult(response)
@@ -217,9 +264,7 @@ class DistributedAPI:
 
         status = wazuh.core.manager.status()
 
-        not_ready_daemons = {k: status[k] for k in self.basic_services if status[k] in ('failed',
-                                                                                        'restarting',
-                                                                                        'stopped')}
+        not_ready_daemons = {k: status[k] for k in self.basic_services if status[k] in NOT_READY_STATUS}
 
         if not_ready_daemons:
             extra_info = {
@@ -230,23 +275,33 @@ class DistributedAPI:
 
     @staticmethod
     def run_local(f, f_kwargs, rbac_permissions, broadcasting, nodes, current_user, origin_module):
-        """Run framework SDK function locally in another process."""
-        common.rbac.set(rbac_permissions)
-        common.broadcast.set(broadcasting)
-        common.cluster_nodes.set(nodes)
-        common.current_user.set(current_user)
-        common.origin_module.set(origin_module)
-        data = f(**f_kwargs)
+        """Run framework SDK function locally in another process.
+
+        Synchronous functions run in a copy of the current context, so the variables and context cache they set are
+        dropped when they finish. Coroutines are awaited by the caller and need the variables in its context.
+        """
+        def run():
+            common.rbac.set(rbac_permissions)
+            common.broadcast.set(broadcasting)
+            common.cluster_nodes.set(nodes)
+            common.current_user.set(current_user)
+            common.origin_module.set(origin_module)
+            return f(**f_kwargs)
+
+        if not asyncio.iscoroutinefunction(inspect.unwrap(f)):
+            return contextvars.copy_context().run(run)
+
+        data = run()
         common.reset_context_cache()
         return data
 
-    async def execute_local_request(self) -> str:
+    async def execute_local_request(self) -> [wresults.AbstractWazuhResult, exception.WazuhException]:
         """Execute an API request locally.
 
         Returns
         -------
-        str
-            JSON response.
+        AbstractWazuhResult or WazuhException
+            Result of the framework function or the exception raised while running it.
         """
         try:
             if self.f_kwargs.get('agent_list') == '*':
@@ -266,6 +321,14 @@ class DistributedAPI:
                     task = self.run_local(self.f, self.f_kwargs, self.rbac_permissions, self.broadcasting,
                                           self.nodes, self.current_user, self.origin_module)
 
+                elif getattr(self.f, '_fast_sync', False):
+                    # The executor handoff would take longer than the function itself
+                    async def run_inline():
+                        return self.run_local(self.f, self.f_kwargs, self.rbac_permissions, self.broadcasting,
+                                              self.nodes, self.current_user, self.origin_module)
+
+                    task = run_inline()
+
                 else:
                     loop = asyncio.get_event_loop()
                     if 'thread_pool' in pools:
@@ -306,19 +369,17 @@ class DistributedAPI:
                                                                                            exception.WazuhClusterError))
             if self.debug:
                 raise
-            return json.dumps(e, cls=c_common.WazuhJSONEncoder)
+            return e
         except (exception.WazuhError, exception.WazuhResourceNotFound) as e:
             e.dapi_errors = self.get_error_info(e)
             if self.debug:
                 raise
-            return json.dumps(e, cls=c_common.WazuhJSONEncoder)
+            return e
         except Exception as e:
             self.logger.error(f'Error executing API request locally: {str(e)}', exc_info=True)
             if self.debug:
                 raise
-            return json.dumps(exception.WazuhInternalError(1000,
-                                                           dapi_errors=self.get_error_info(e)),
-                              cls=c_common.WazuhJSONEncoder)
+            return exception.WazuhInternalError(1000, dapi_errors=self.get_error_info(e))
 
     def get_client(self) -> c_common.Handler:
         """
@@ -380,11 +441,7 @@ class DistributedAPI:
 
         # Give log path only in case of WazuhInternalError
         if isinstance(e, exception.WazuhInternalError):
-            log_filename = None
-            for h in self.logger.handlers or self.logger.parent.handlers:
-                if hasattr(h, 'baseFilename'):
-                    log_filename = os.path.join('WAZUH_HOME', os.path.relpath(h.baseFilename, start=common.WAZUH_PATH))
-            result[node]['logfile'] = log_filename
+            result[node]['logfile'] = get_log_filename(self.logger)
 
         return result
 
@@ -392,10 +449,9 @@ class DistributedAPI:
         # POST/agent/group/:group_id/configuration and POST/agent/group/:group_id/file/:file_name API calls write
         # a temporary file in /var/ossec/tmp which needs to be sent to the master before forwarding the request
         client = self.get_client()
-        res = json.loads(await client.send_file(os.path.join(common.WAZUH_PATH,
-                                                             self.f_kwargs['tmp_file']),
-                                                node_name),
-                         object_hook=c_common.as_wazuh_object)
+        res = c_common.wazuh_json_loads(await client.send_file(os.path.join(common.WAZUH_PATH,
+                                                                            self.f_kwargs['tmp_file']),
+                                                               node_name))
         os.remove(os.path.join(common.WAZUH_PATH, self.f_kwargs['tmp_file']))
 
     async def execute_remote_request(self) -> Dict:
@@ -410,11 +466,8 @@ class DistributedAPI:
             await self.send_tmp_file()
 
         client = self.get_client()
-        node_response = await client.execute(command=b'dapi',
-                                             data=json.dumps(self.to_dict(),
-                                                             cls=c_common.WazuhJSONEncoder).encode())
-        return json.loads(node_response,
-                          object_hook=c_common.as_wazuh_object)
+        node_response = await client.execute(command=b'dapi', data=c_common.wazuh_json_dumps(self.to_dict()))
+        return c_common.wazuh_json_loads(node_response)
 
     async def forward_request(self) -> [wresults.AbstractWazuhResult, exception.WazuhException]:
         """Forward a request to the node who has all available information to answer it.
@@ -451,17 +504,16 @@ class DistributedAPI:
                     await self.send_tmp_file(node_name)
                 client = self.get_client()
                 try:
-                    kcopy = deepcopy(self.to_dict())
-                    if agent_list is not None and set(self.f_kwargs) & {'agent_id', 'agent_list'}:
-                        kcopy['f_kwargs']['agent_id' if 'agent_id' in kcopy['f_kwargs'] else 'agent_list'] = agent_list
-
-                    result = json.loads(await client.execute(b'dapi_fwd',
-                                                             "{} {}".format(node_name,
-                                                                            json.dumps(kcopy,
-                                                                                       cls=c_common.WazuhJSONEncoder)
-                                                                            ).encode()
-                                                             ),
-                                        object_hook=c_common.as_wazuh_object)
+                    if agents_key is None:
+                        f_kwargs_bytes = base_f_kwargs_bytes
+                    else:
+                        agents = agent_list if agent_list is not None else base_f_kwargs[agents_key]
+                        f_kwargs_bytes = merge_json_objects(base_f_kwargs_bytes,
+                                                            c_common.wazuh_json_dumps({agents_key: agents}))
+                    request = merge_json_objects(base_request_bytes, b'{"f_kwargs":' + f_kwargs_bytes + b'}')
+
+                    result = c_common.wazuh_json_loads(await client.execute(b'dapi_fwd',
+                                                                            node_name.encode() + b' ' + request))
                 except WazuhClusterError as e:
                     if e.code == 3022:
                         result = e
@@ -483,6 +535,27 @@ class DistributedAPI:
             return result if isinstance(result, (wresults.AbstractWazuhResult, exception.WazuhException)) \
                 else wresults.WazuhResult(result)
 
+        def merge_json_objects(first: bytes, second: bytes) -> bytes:
+            """Merge two serialized JSON objects with different keys into a single one.
+
+            Parameters
+            ----------
+            first : bytes
+                First JSON object.
+            second : bytes
+                Second JSON object.
+
+            Returns
+            -------
+            bytes
+                JSON object containing the keys of both objects.
+            """
+            if first == b'{}':
+                return second
+            if second == b'{}':
+                return first
+            return first[:-1] + b',' + second[1:]
+
         async def clean_valid_nodes(nodes_to_clean: List[Tuple]) -> List[Tuple]:
             """Clean nodes response to forward only to real nodes in a single petition for each one.
 
@@ -546,10 +619,21 @@ class DistributedAPI:
 
         cleaned_valid_nodes = await clean_valid_nodes(valid_nodes)
 
+        # Requests forwarded to other nodes only differ in their agents, so the rest is serialized just once
+        agents_key = next((key for key in ('agent_id', 'agent_list') if key in self.f_kwargs), None)
+        base_f_kwargs = base_request_bytes = base_f_kwargs_bytes = None
+        if any(node_name != self.node_info['node'] for node_name, _ in cleaned_valid_nodes):
+            base_request = self.to_dict()
+            base_f_kwargs = base_request.pop('f_kwargs')
+            base_request_bytes = c_common.wazuh_json_dumps(base_request)
+            base_f_kwargs_bytes = c_common.wazuh_json_dumps({k: v for k, v in base_f_kwargs.items()
+                                                             if k != agents_key})
+
         response = await asyncio.shield(asyncio.gather(*[forward(node) for node in cleaned_valid_nodes]))
 
         if allowed_nodes.total_affected_items > 1:
-            response = reduce(or_, response)
+            response = response[0].merge_all(response) if isinstance(response[0], wresults.AbstractWazuhResult) \
+                else reduce(or_, response)
             if isinstance(response, wresults.AbstractWazuhResult):
                 response = response.limit(limit=self.f_kwargs.get('limit', common.DATABASE_LIMIT),
                                           offset=self.f_kwargs.get('offset', 0)) \
@@ -597,7 +681,8 @@ class DistributedAPI:
 
             system_agents = agent.Agent.get_agents_overview(select=select_node,
                                                             limit=None,
-                                                            filters=filters)['items']
+                                                            filters=filters,
+                                                            count=False)['items']
             node_name = defaultdict(list)
             for element in system_agents:
                 node_name[element.get('node_name', '')].append(element['id'])
@@ -609,7 +694,9 @@ class DistributedAPI:
 
             if requested_agents != '*':  # When all agents are requested cannot be non existent ids
                 # Add non existing ids in the master's dictionary entry
-                non_existent_ids = list(set(requested_agents) - set(map(operator.itemgetter('id'), system_agents)))
+                existing_ids = set(map(operator.itemgetter('id'), system_agents))
+                non_existent_ids = list(dict.fromkeys(agent_id for agent_id in requested_agents
+                                                      if agent_id not in existing_ids))
                 if non_existent_ids:
                     if self.node_info['node'] in node_name:
                         node_name[self.node_info['node']].extend(non_existent_ids)
@@ -628,7 +715,7 @@ class DistributedAPI:
             else:
                 # agents, syscheck and syscollector
                 # API calls that affect all agents. For example, PUT/agents/restart, etc...
-                agents = agent.Agent.get_agents_overview(select=select_node, limit=None,
+                agents = agent.Agent.get_agents_overview(select=select_node, limit=None, count=False,
                                                          sort={'fields': ['node_name'], 'order': 'desc'})['items']
                 node_name = {k: [] for k, _ in itertools.groupby(agents, key=operator.itemgetter('node_name'))}
             return node_name
@@ -649,7 +736,8 @@ class WazuhRequestQueue:
         request : bytes
             Request to add.
         """
-        self.logger.debug(f"Received request: {request}")
+        # Let the logger format the request, building the repr of a big payload is wasted if debug is disabled
+        self.logger.debug("Received request: %s", request)
         self.request_queue.put_nowait(request.decode())
 
 
@@ -682,13 +770,13 @@ class APIRequestQueue(WazuhRequestQueue):
                 continue
 
             try:
-                request = json.loads(request, object_hook=c_common.as_wazuh_object)
+                request = c_common.wazuh_json_loads(request)
                 self.logger.info("Receiving request: {} from {}".format(
                     request['f'].__name__, names[0] if not name_2 else '{} ({})'.format(names[0], names[1])))
                 result = await DistributedAPI(**request,
                                               logger=self.logger,
                                               node=node).distribute_function()
-                task_id = await node.send_string(json.dumps(result, cls=c_common.WazuhJSONEncoder).encode())
+                task_id = await node.send_string(c_common.wazuh_json_dumps(result))
             except Exception as e:
                 self.logger.error(f"Error in distributed API: {e}", exc_info=True)
                 with contextlib.suppress(Exception):
@@ -727,7 +815,7 @@ class SendSyncRequestQueue(WazuhRequestQueue):
                 continue
 
             try:
-                request = json.loads(request, object_hook=c_common.as_wazuh_object)
+                request = c_common.wazuh_json_loads(request)
                 self.logger.debug(f"Receiving SendSync request ({request['daemon_name']}) from {names[0]} ({names[1]})")
                 result = await wazuh_sendasync(**request)
                 task_id = await node.send_string(result)
@@ -29,13 +29,14 @@ with patch('wazuh.common.wazuh_uid'):
         from wazuh.tests.util import RBAC_bypasser
 
         wazuh.rbac.decorators.expose_resources = RBAC_bypasser
-        from wazuh.core.cluster.dapi.dapi import DistributedAPI, APIRequestQueue, SendSyncRequestQueue
+        from wazuh.core.cluster.dapi.dapi import DistributedAPI, APIRequestQueue, SendSyncRequestQueue, get_log_filename
         from wazuh.core.manager import get_manager_status
         from wazuh.core.results import WazuhResult, AffectedItemsWazuhResult
         from wazuh import agent, cluster, ciscat, manager, WazuhError, WazuhInternalError
-        from wazuh.core.exception import WazuhClusterError
+        from wazuh.core.exception import WazuhClusterError, WazuhException
         from api.util import raise_if_exc
         from wazuh.core.cluster import local_client
+        from wazuh.core.cluster.common import WazuhJSONEncoder
 
 logger = logging.getLogger('wazuh')
 loop = asyncio.new_event_loop()
@@ -170,6 +171,18 @@ def test_DistributedAPI_distribute_function(api_request, request_type, node, exp
             assert data.render()['result'] == expected
 
 
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.execute_local_request',
+       new=AsyncMock(return_value=WazuhResult({'result': 'local'})))
+def test_DistributedAPI_distribute_function_cluster_status_reused():
+    """Check that the cluster status is only checked once per DistributedAPI instance."""
+    with patch('wazuh.core.cluster.dapi.dapi.check_cluster_status', return_value=False) as check_mock:
+        dapi = DistributedAPI(f=manager.status, logger=logger)
+        for _ in range(2):
+            raise_if_exc(loop.run_until_complete(dapi.distribute_function()))
+        check_mock.assert_called_once()
+        assert dapi.is_cluster_disabled
+
+
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.execute_local_request',
        new=AsyncMock(return_value=WazuhResult({'result': 'local'})))
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.get_solver_node',
@@ -226,6 +239,25 @@ def test_DistributedAPI_distribute_function_exception():
             dapi.get_error_info(Exception("testing"))
 
 
+def test_get_log_filename():
+    """Check that the log file path is built once per logger and that missing paths are not cached."""
+    # The parent logger must exist and have no handlers, otherwise the root logger handlers are inspected
+    logger_ = logging.getLogger('test_get_log_filename').getChild('child')
+    handler = logging.FileHandler(os.path.join(common.WAZUH_PATH, 'logs', 'test.log'), delay=True)
+
+    with patch('wazuh.core.cluster.dapi.dapi.log_filenames', {}):
+        assert get_log_filename(logger_) is None
+
+        logger_.addHandler(handler)
+        try:
+            with patch('wazuh.core.cluster.dapi.dapi.os.path.relpath', wraps=os.path.relpath) as relpath_mock:
+                for _ in range(2):
+                    assert get_log_filename(logger_) == os.path.join('WAZUH_HOME', 'logs', 'test.log')
+                relpath_mock.assert_called_once()
+        finally:
+            logger_.removeHandler(handler)
+
+
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.execute_local_request',
        new=AsyncMock(return_value='{wrong\': json}'))
 def test_DistributedAPI_invalid_json():
@@ -266,6 +298,56 @@ def test_DistributedAPI_local_request_errors():
             raise_if_exc_routine(dapi_kwargs=dapi_kwargs, expected_error=3036)
 
 
+def test_DistributedAPI_run_local():
+    """Check that `run_local` only keeps the context variables when the function is a coroutine."""
+
+    def sync_f():
+        return common.current_user.get(), common.cluster_nodes.get()
+
+    async def async_f():
+        return common.current_user.get(), common.cluster_nodes.get()
+
+    def run(f):
+        return DistributedAPI.run_local(f, {}, {'rbac_mode': 'black'}, False, ['master'], 'wazuh', 'framework')
+
+    async def run_async():
+        # Run inside a task to avoid leaking the context variables to other tests
+        return await run(async_f), common.current_user.get()
+
+    common.current_user.set('')
+    assert run(sync_f) == ('wazuh', ['master'])
+    assert common.current_user.get() == ''
+
+    assert loop.run_until_complete(run_async()) == (('wazuh', ['master']), 'wazuh')
+    assert common.current_user.get() == ''
+
+
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.check_wazuh_status')
+def test_DistributedAPI_local_request_fast_sync(check_status_mock):
+    """Check that functions marked with `fast_sync` are run inline instead of in the executor pools."""
+    with patch('wazuh.core.cluster.utils.get_manager_status', return_value={'wazuh-clusterd': 'running'}), \
+            patch('asyncio.BaseEventLoop.run_in_executor') as run_in_executor_mock:
+        dapi = DistributedAPI(f=cluster.get_status_json, logger=logger)
+        result = loop.run_until_complete(dapi.execute_local_request())
+
+    run_in_executor_mock.assert_not_called()
+    assert isinstance(result, WazuhResult)
+    assert result['data']['running'] == 'yes'
+
+
+@pytest.mark.parametrize('side_effect', [WazuhInternalError(1001), WazuhError(1017), KeyError('Testing')])
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.check_wazuh_status')
+def test_DistributedAPI_local_request_errors_not_encoded(check_status_mock, side_effect):
+    """Check that `execute_local_request` returns the exceptions without encoding them."""
+    dapi = DistributedAPI(f=manager.status, logger=logger)
+    with patch('asyncio.wait_for', new=AsyncMock(side_effect=side_effect)):
+        result = loop.run_until_complete(dapi.execute_local_request())
+
+    assert isinstance(result, WazuhException)
+    assert result.code == getattr(side_effect, 'code', 1000)
+    assert result.dapi_errors
+
+
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.check_wazuh_status', side_effect=None)
 @patch('asyncio.wait_for', new=AsyncMock(return_value='Testing'))
 def test_DistributedAPI_local_request(mock_local_request):
@@ -402,6 +484,30 @@ def test_DistributedAPI_forward_request_errors(mock_client_execute, mock_get_sol
     raise_if_exc_routine(dapi_kwargs=dapi_kwargs, expected_error=3036)
 
 
+@patch('wazuh.core.cluster.cluster.get_node', return_value={'type': 'master', 'node': 'master-node'})
+@patch('wazuh.core.cluster.dapi.dapi.check_cluster_status', return_value=True)
+@patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.get_solver_node',
+       new=AsyncMock(return_value={'worker1': ['001', '002'], 'worker2': ['003']}))
+def test_DistributedAPI_forward_request_payload(mock_check_cluster_status, mock_get_node):
+    """Check that each node receives its own agents without modifying the original request."""
+    execute_mock = AsyncMock(return_value=json.dumps(AffectedItemsWazuhResult(), cls=WazuhJSONEncoder))
+    with patch('wazuh.core.cluster.local_client.LocalClient.execute', new=execute_mock):
+        dapi = DistributedAPI(f=agent.reconnect_agents, logger=logger, request_type='distributed_master',
+                              f_kwargs={'agent_list': ['001', '002', '003'], 'select': ['id']})
+        assert isinstance(loop.run_until_complete(dapi.distribute_function()), AffectedItemsWazuhResult)
+
+    sent = {}
+    for execute_call in execute_mock.mock.call_args_list:
+        command, data = execute_call.args[-2:]
+        assert command == b'dapi_fwd'
+        node_name, payload = data.split(b' ', 1)
+        sent[node_name] = json.loads(payload)
+    expected_request = json.loads(json.dumps(dapi.to_dict(), cls=WazuhJSONEncoder))
+    assert sent == {b'worker1': {**expected_request, 'f_kwargs': {'agent_list': ['001', '002'], 'select': ['id']}},
+                    b'worker2': {**expected_request, 'f_kwargs': {'agent_list': ['003'], 'select': ['id']}}}
+    assert dapi.f_kwargs['agent_list'] == ['001', '002', '003']
+
+
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI.execute_local_request',
        new=AsyncMock(side_effect=WazuhInternalError(1001)))
 def test_DistributedAPI_logger():
@@ -513,6 +619,21 @@ def test_DistributedAPI_get_solver_node(mock_cluster_status, mock_agents_overvie
                            'f_kwargs': {'node_list': '*'}, 'broadcasting': True, 'nodes': ['master']}
             raise_if_exc_routine(dapi_kwargs=dapi_kwargs)
 
+    # totalItems is never read when solving the nodes, so no count query must be requested
+    assert mock_agents_overview.call_count
+    assert all(call.kwargs['count'] is False for call in mock_agents_overview.call_args_list)
+
+
+@patch('wazuh.agent.Agent.get_agents_overview', return_value={'items': [{'id': '001', 'node_name': 'worker1'},
+                                                                        {'id': '003', 'node_name': 'master'}]})
+def test_DistributedAPI_get_solver_node_non_existent_ids(mock_agents_overview):
+    """Check that `get_solver_node` assigns the non-existent agents to the master node, in request order."""
+    with patch('wazuh.core.cluster.cluster.get_node', return_value={'type': 'master', 'node': 'master'}):
+        dapi = DistributedAPI(f=manager.status, logger=logger, request_type='distributed_master',
+                              f_kwargs={'agent_list': ['005', '001', '002', '005', '003']})
+        assert loop.run_until_complete(dapi.get_solver_node()) == {'worker1': ['001'],
+                                                                    'master': ['003', '005', '002']}
+
 
 @pytest.mark.parametrize('api_request', [
     agent.get_agents_summary_status,
@@ -553,9 +674,12 @@ def test_APIRequestQueue_init(queue_mock):
     """Test `APIRequestQueue` constructor."""
     server = DistributedAPI(f=agent.get_agents_summary_status, logger=logger)
     api_request_queue = APIRequestQueue(server=server)
-    api_request_queue.add_request(b'testing')
+    with patch.object(api_request_queue.logger, 'debug') as debug_mock:
+        api_request_queue.add_request(b'testing')
+        debug_mock.assert_called_once_with("Received request: %s", b'testing')
     assert api_request_queue.server == server
     queue_mock.assert_called_once()
+    queue_mock.return_value.put_nowait.assert_called_once_with('testing')
 
 
 @patch("wazuh.core.cluster.common.import_module", return_value="os.path")
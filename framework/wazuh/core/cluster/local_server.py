@@ -4,9 +4,9 @@
 
 import asyncio
 import functools
+import itertools
 import json
 import os
-import random
 from typing import Tuple, Union
 
 import uvloop
@@ -17,6 +17,9 @@ from wazuh.core.cluster.dapi import dapi
 from wazuh.core.cluster.utils import context_tag
 from wazuh.core.exception import WazuhClusterError
 
+# Sequential IDs used to name the local clients. Unlike random names, they cannot collide.
+client_ids = itertools.count()
+
 
 class LocalServerHandler(server.AbstractServerHandler):
     """
@@ -31,7 +34,7 @@ class LocalServerHandler(server.AbstractServerHandler):
         transport : asyncio.Transport
             Socket to write data on.
         """
-        self.name = str(random.SystemRandom().randint(0, 2 ** 20 - 1))
+        self.name = str(next(client_ids))
         self.transport = transport
         self.server.clients[self.name] = self
         self.tag = "Local " + self.name
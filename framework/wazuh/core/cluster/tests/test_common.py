@@ -1742,6 +1742,47 @@ def test_wazuh_json_encoder_default():
             wazuh_encoder.default({"key": "value"})
 
 
+def test_wazuh_json_dumps():
+    """Check that `wazuh_json_dumps` encodes the same objects as WazuhJSONEncoder."""
+    obj = {'date': datetime(2021, 10, 15), 1: exception.WazuhException(3012), 'tuple': ('a', 'b'),
+           'result': wresults.AffectedItemsWazuhResult()}
+
+    result = cluster_common.wazuh_json_dumps(obj)
+    assert isinstance(result, bytes)
+    assert json.loads(result) == json.loads(json.dumps(obj, cls=cluster_common.WazuhJSONEncoder))
+    assert json.loads(result, object_hook=cluster_common.as_wazuh_object)['date'] == datetime(2021, 10, 15)
+
+    # Integers bigger than 64 bits are not supported by orjson
+    assert cluster_common.wazuh_json_dumps({'big': 2 ** 70}) == b'{"big": 1180591620717411303424}'
+    # Neither are strings with surrogates
+    assert cluster_common.wazuh_json_dumps({'str': '\ud800'}) == b'{"str": "\\ud800"}'
+
+    with pytest.raises(TypeError):
+        cluster_common.wazuh_json_dumps({'set'})
+
+
+@pytest.mark.parametrize('data', [
+    '{"items": [{"id": "001"}], "totalItems": 1}',
+    b'{"items": [{"id": "001"}], "totalItems": 1}'
+])
+def test_wazuh_json_loads_plain(data):
+    """Check that `wazuh_json_loads` does not use the object hook if there are no encoded objects."""
+    with patch('wazuh.core.cluster.common.as_wazuh_object') as as_wazuh_object_mock:
+        assert cluster_common.wazuh_json_loads(data) == {'items': [{'id': '001'}], 'totalItems': 1}
+        as_wazuh_object_mock.assert_not_called()
+
+
+def test_wazuh_json_loads():
+    """Check that `wazuh_json_loads` rebuilds the objects encoded by WazuhJSONEncoder."""
+    obj = {'date': datetime(2021, 10, 15), 'error': exception.WazuhException(3012)}
+    result = cluster_common.wazuh_json_loads(cluster_common.wazuh_json_dumps(obj))
+    assert result['date'] == obj['date']
+    assert isinstance(result['error'], exception.WazuhException) and result['error'].code == 3012
+
+    with pytest.raises(json.JSONDecodeError):
+        cluster_common.wazuh_json_loads('{"__wrong": json}')
+
+
 def test_as_wazuh_object_ok():
     """Test the different outputs taking into account the input values."""
 
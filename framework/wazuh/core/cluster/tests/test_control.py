@@ -125,12 +125,14 @@ async def test_get_agents():
 @pytest.mark.asyncio
 async def test_get_system_nodes():
     """Verify that get_system_nodes function returns the name of all cluster nodes."""
+    control.system_nodes_cache.clear()
     with patch('wazuh.core.cluster.local_client.LocalClient.execute', side_effect=async_local_client):
         expected_result = [{'items': [{'name': 'master'}]}]
         for expected in expected_result:
             with patch('wazuh.core.cluster.control.get_nodes', return_value=expected):
                 result = await control.get_system_nodes()
                 assert result == [expected['items'][0]['name']]
+            control.system_nodes_cache.clear()
 
         with patch('wazuh.core.cluster.control.get_nodes', side_effect=WazuhInternalError(3012)):
             result = await control.get_system_nodes()
@@ -144,6 +146,23 @@ async def test_get_system_nodes():
             await control.get_system_nodes()
 
 
+@pytest.mark.asyncio
+async def test_get_system_nodes_cache():
+    """Verify that get_system_nodes reuses the node names until the cache expires."""
+    control.system_nodes_cache.clear()
+    with patch('wazuh.core.cluster.control.get_nodes', return_value={'items': [{'name': 'master'}]}) as get_nodes_mock:
+        result = await control.get_system_nodes()
+        result.append('worker1')
+        assert await control.get_system_nodes() == ['master']
+        get_nodes_mock.assert_called_once()
+
+        control.system_nodes_cache.clear()
+        assert await control.get_system_nodes() == ['master']
+        assert get_nodes_mock.call_count == 2
+
+    control.system_nodes_cache.clear()
+
+
 @pytest.mark.asyncio
 async def test_get_node_ruleset_integrity():
     """Verify that get_node_ruleset_integrity function uses the expected command."""
@@ -52,6 +52,12 @@ async def test_LocalServerHandler_connection_made(event_loop):
 
             logger_debug_mock.assert_called_once_with("Connection received in local server.")
 
+            # Every new connection gets a different name
+            lsh_2 = LocalServerHandler(server=ServerMock(), loop=event_loop, fernet_key=None, cluster_items={},
+                                       logger=logger)
+            lsh_2.connection_made(transport=transport)
+            assert lsh_2.name == str(int(lsh.name) + 1)
+
 
 @pytest.mark.asyncio
 @patch("wazuh.core.cluster.local_server.server.AbstractServerHandler.process_request")
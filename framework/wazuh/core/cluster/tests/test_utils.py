@@ -367,7 +367,7 @@ def test_process_spawn_sleep(pyDaemon_create_pid_mock, get_pid_mock):
 
 
 @pytest.mark.asyncio
-@patch('concurrent.futures.ThreadPoolExecutor')
+@patch('wazuh.core.cluster.utils.get_forward_function_pool')
 @patch('wazuh.core.cluster.dapi.dapi.DistributedAPI')
 async def test_forward_function(distributed_api_mock, concurrent_mock):
     """Check if the function is correctly distributed to the master node."""
@@ -402,6 +402,17 @@ async def test_forward_function(distributed_api_mock, concurrent_mock):
     concurrent_mock.assert_called_once()
 
 
+@patch('wazuh.core.cluster.utils.ThreadPoolExecutor')
+def test_get_forward_function_pool(thread_pool_mock):
+    """Check that the same thread pool is returned in every call."""
+    utils.get_forward_function_pool.cache_clear()
+    try:
+        assert utils.get_forward_function_pool() is utils.get_forward_function_pool()
+        thread_pool_mock.assert_called_once()
+    finally:
+        utils.get_forward_function_pool.cache_clear()
+
+
 @pytest.mark.parametrize(
     'cluster_config,expected',
     (
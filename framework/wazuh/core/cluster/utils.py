@@ -11,6 +11,7 @@ import signal
 import socket
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from contextvars import ContextVar
 from functools import lru_cache
 from glob import glob
@@ -517,15 +518,27 @@ async def forward_function(func: callable, f_kwargs: dict = None, request_type:
     Return either a dict or `WazuhResult` instance in case the execution did not fail. Return an exception otherwise.
     """
 
-    import concurrent
     from asyncio import run
 
     from wazuh.core.cluster.dapi.dapi import DistributedAPI
     dapi = DistributedAPI(f=func, f_kwargs=f_kwargs, request_type=request_type,
                           is_async=False, wait_for_complete=True, logger=logger, nodes=nodes,
                           broadcasting=broadcasting)
-    pool = concurrent.futures.ThreadPoolExecutor()
-    return pool.submit(run, dapi.distribute_function()).result()
+    return get_forward_function_pool().submit(run, dapi.distribute_function()).result()
+
+
+@lru_cache()
+def get_forward_function_pool() -> ThreadPoolExecutor:
+    """Get the thread pool used to run forwarded functions.
+
+    The pool is created on first use and shared by every `forward_function` call.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        Shared thread pool.
+    """
+    return ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1))
 
 
 def running_in_master_node() -> bool:
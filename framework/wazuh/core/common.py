@@ -11,7 +11,7 @@ from functools import lru_cache, wraps
 from grp import getgrnam
 from multiprocessing import Event
 from pwd import getpwnam
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 
 # ===================================================== Functions ======================================================
@@ -107,6 +107,25 @@ def context_cached(key: str = '') -> Any:
     return decorator
 
 
+def fast_sync(func: Callable) -> Callable:
+    """Mark a synchronous framework function as cheap enough to run without the DAPI executor pools.
+
+    Only functions that do not block (no sockets, no database queries, no big files) should be marked.
+
+    Parameters
+    ----------
+    func : callable
+        Function to mark.
+
+    Returns
+    -------
+    callable
+        The same function with the `_fast_sync` attribute set.
+    """
+    func._fast_sync = True
+    return func
+
+
 def reset_context_cache() -> None:
     """Reset context cache."""
 
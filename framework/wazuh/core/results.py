@@ -4,10 +4,13 @@
 
 import builtins
 import collections
+import heapq
 import re
 import sys
 from copy import deepcopy
+from functools import cmp_to_key, reduce
 from numbers import Number
+from operator import or_
 from typing import Union, Iterable
 
 import wazuh.core.exception as wexception
@@ -116,6 +119,23 @@ class AbstractWazuhResult(collections.abc.MutableMapping):
 
         return result
 
+    @classmethod
+    def merge_all(cls, results: list):
+        """Merge a list of results into a single one. It is equivalent to applying the | operator from left to right.
+        This method may be redefined in subclasses to merge all the results at once.
+
+        Parameters
+        ----------
+        results : list
+            Results to merge. The first one must be an instance of cls.
+
+        Returns
+        -------
+        AbstractWazuhResult or wexception.WazuhException
+            Resultant object.
+        """
+        return reduce(or_, results)
+
     def _merge_dict(self, self_field: dict, other_field: dict, key: str = None) -> dict:
         """Merge two dict objects when merging two results recursively converting each of them to the specific
         AbstractWazuhResult subclass. This method may be redefined in subclasses.
@@ -480,6 +500,37 @@ class AffectedItemsWazuhResult(AbstractWazuhResult):
 
         return result
 
+    @classmethod
+    def merge_all(cls, results: list):
+        """Merge a list of results into a single one. It is equivalent to applying the | operator from left to right,
+        but the affected items of every result are merged in a single pass.
+
+        Parameters
+        ----------
+        results : list
+            Results to merge. The first one must be an instance of AffectedItemsWazuhResult.
+
+        Returns
+        -------
+        AffectedItemsWazuhResult or wexception.WazuhException
+            Resultant object.
+        """
+        if not all(isinstance(result, AffectedItemsWazuhResult) for result in results):
+            return super().merge_all(results)
+
+        first = results[0]
+        result = first
+        for other in results[1:]:
+            result = AbstractWazuhResult.__or__(result, other)
+            result.add_failed_items_from(other)
+        result.affected_items = merge(*[other.affected_items for other in results],
+                                      criteria=first.sort_fields,
+                                      ascending=first.sort_ascending,
+                                      types=first.sort_casting)
+        result.total_affected_items = sum(other.total_affected_items for other in results)
+
+        return result
+
     def to_dict(self) -> dict:
         """Return the AffectedItemsWazuhResult as a dict.
 
@@ -827,24 +878,21 @@ def merge(*iterables, criteria: Union[tuple, list] = None, ascending: Union[tupl
     Iterable
         A new sorted iterable.
     """
-    result = list()
-    final_len = sum([len(iterable) for iterable in iterables])
     if criteria is None:
         getters = [lambda x: x]  # Init dummy itemgetter
     else:
         getters = [nested_itemgetter(criterion) for criterion in criteria]
     casters = [getattr(builtins, type_) for type_ in types]
-    while len(result) < final_len:
-        selected = None
-        for i, iterable in enumerate(iterables):
-            if len(iterable) > 0:
-                if selected is None:
-                    selected = i
-                else:
-                    candidate = [getter(iterable[0]) for getter in getters]
-                    selected_candidate = [getter(iterables[selected][0]) for getter in getters]
-                    if _goes_before_than(candidate, selected_candidate, ascending=ascending, casters=casters):
-                        selected = i
-        result.append(iterables[selected].pop(0))
-
-    return result
+
+    def compare(a: tuple, b: tuple) -> int:
+        if _goes_before_than(a[0], b[0], ascending=ascending, casters=casters):
+            return -1
+        elif _goes_before_than(b[0], a[0], ascending=ascending, casters=casters):
+            return 1
+        return 0
+
+    # Items are compared by their criteria values, computed once per item. On a tie, heapq.merge takes the item from
+    # the first iterable
+    decorated = [[([getter(item) for getter in getters], item) for item in iterable] for iterable in iterables]
+
+    return [item for _, item in heapq.merge(*decorated, key=cmp_to_key(compare))]
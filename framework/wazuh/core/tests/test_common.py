@@ -11,7 +11,7 @@ from unittest.mock import patch
 import pytest
 
 from wazuh.core.common import find_wazuh_path, wazuh_uid, wazuh_gid, context_cached, reset_context_cache, \
-    get_context_cache
+    get_context_cache, fast_sync
 
 
 @pytest.mark.parametrize('fake_path, expected', [
@@ -76,6 +76,17 @@ def test_context_cached():
                       ContextVar)
 
 
+def test_fast_sync():
+    """Verify that fast_sync decorator marks the function without wrapping it."""
+
+    def foo():
+        return 'bar'
+
+    assert not hasattr(foo, '_fast_sync')
+    assert fast_sync(foo) is foo
+    assert foo._fast_sync is True and foo() == 'bar'
+
+
 @patch('wazuh.core.logtest.create_wazuh_socket_message', side_effect=SystemExit)
 def test_origin_module_context_var_framework(mock_create_socket_msg):
     """Test that the origin_module context variable is being set to framework."""
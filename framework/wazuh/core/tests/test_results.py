@@ -157,6 +157,35 @@ def test_results_AffectedItemsWazuhResult___or__(get_wazuh_failed_item):
     assert or_result_2.failed_items == failed_item.failed_items
 
 
+def test_results_AffectedItemsWazuhResult_merge_all(get_wazuh_failed_item):
+    """Test method `merge_all` from class `AffectedItemsWazuhResult`."""
+    def get_results():
+        return [AffectedItemsWazuhResult(dikt={'older_than': '7d'}, affected_items=['001', '005']),
+                AffectedItemsWazuhResult(affected_items=['002', '003']),
+                AffectedItemsWazuhResult(affected_items=['004'], total_affected_items=3),
+                get_wazuh_failed_item]
+
+    merged = AffectedItemsWazuhResult.merge_all(get_results())
+    expected = get_results()[0] | get_results()[1] | get_results()[2] | get_results()[3]
+    assert merged.affected_items == ['001', '002', '003', '004', '005'] == expected.affected_items
+    assert merged.total_affected_items == 7 == expected.total_affected_items
+    assert merged.failed_items == expected.failed_items == get_wazuh_failed_item.failed_items
+    assert merged.dikt == expected.dikt == {'older_than': '7d'}
+
+
+@pytest.mark.parametrize('other', [
+    WazuhError(WAZUH_EXCEPTION_CODE, ids=['001']),
+    WazuhException(WAZUH_EXCEPTION_CODE)
+])
+def test_results_AffectedItemsWazuhResult_merge_all_exceptions(other):
+    """Test method `merge_all` from class `AffectedItemsWazuhResult` when merging exceptions."""
+    merged = AffectedItemsWazuhResult.merge_all([AffectedItemsWazuhResult(affected_items=['001']), other])
+    expected = AffectedItemsWazuhResult(affected_items=['001']) | other
+    assert type(merged) == type(expected)
+    if isinstance(merged, AffectedItemsWazuhResult):
+        assert merged.failed_items == expected.failed_items
+
+
 @pytest.mark.parametrize('or_item, expected_result', [
     (WazuhError(WAZUH_EXCEPTION_CODE, ids=['001']), AffectedItemsWazuhResult),
     (WazuhError(WAZUH_EXCEPTION_CODE), WazuhException),
@@ -315,6 +344,10 @@ def test_results__goes_before_than(a, b, ascending, casters, expected_result):
     ((['001', '002'], ['003', '004']), None, [True], ['int'], ['001', '002', '003', '004']),
     ((['001', '002'], ['003', '004']), None, [False], ['int'], ['003', '004', '001', '002']),
     ((['001', '002'], ['003', '004']), ['1'], [True], ['int'], ['001', '002', '003', '004']),
+    (([{'id': '003'}], [{'id': '001'}], [{'id': '002'}]), ['id'], [True], ['int'],
+     [{'id': '001'}, {'id': '002'}, {'id': '003'}]),
+    (([{'id': '1', 'n': 'a'}], [{'id': '1', 'n': 'b'}]), ['id'], [True], ['int'],
+     [{'id': '1', 'n': 'a'}, {'id': '1', 'n': 'b'}]),
 ])
 def test_results_merge(iterables, criteria, ascending, types, expected_result):
     """Test function `merge` from module results.
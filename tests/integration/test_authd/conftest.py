@@ -5,6 +5,7 @@ This program is free software; you can redistribute it and/or modify it under th
 """
 import pytest
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from wazuh_testing.constants.paths.logs import WAZUH_LOG_PATH
 from wazuh_testing.utils.callbacks import generate_callback
@@ -79,11 +80,10 @@ def set_up_groups(test_metadata, request):
     """
     Create and delete groups for test.
     """
-    groups = test_metadata['groups']
-    for group in groups:
-        if(group):
-            create_group(group)
+    groups = [group for group in test_metadata['groups'] if group]
+    # Every agent_groups call is a separate process, run them all at once instead of one after another
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(create_group, groups))
     yield
-    for group in groups:
-        if(group):
-            delete_group(group)
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(delete_group, groups))
@@ -44,7 +44,7 @@ references:
 tags:
     - enrollment
 '''
-import time
+import socket
 
 import pytest
 from pathlib import Path
@@ -73,15 +73,17 @@ monitored_sockets_params = [(MODULES_DAEMON, None, True), (WAZUH_DB_DAEMON, None
 
 receiver_sockets, monitored_sockets = None, None  # Set in the fixtures
 
+RESPONSE_TIMEOUT = 10
+
 # Test daemons to restart.
-daemons_handler_configuration = {'all_daemons': True}
+daemons_handler_configuration = {'daemons': [AUTHD_DAEMON]}
 
 
 # Tests
 @pytest.mark.parametrize('test_configuration,test_metadata', zip(test_configuration, test_metadata), ids=test_cases_ids)
 def test_ossec_auth_messages(test_configuration, test_metadata, set_wazuh_configuration,
-                             truncate_monitored_files, configure_sockets_environment, daemons_handler,
-                             wait_for_authd_startup, connect_to_sockets, set_up_groups):
+                             configure_sockets_environment_module, connect_to_sockets_module,
+                             truncate_monitored_files, daemons_handler, wait_for_authd_startup, set_up_groups):
     '''
     description:
         Checks if when the `wazuh-authd` daemon receives different types of enrollment requests,
@@ -109,18 +111,18 @@ def test_ossec_auth_messages(test_configuration, test_metadata, set_wazuh_config
         - set_up_groups:
             type: fixture
             brief: Create a testing group for agents and provide the test case list.
-        - configure_sockets_environment:
+        - configure_sockets_environment_module:
             type: fixture
             brief: Configure environment for sockets and MITM.
+        - connect_to_sockets_module:
+            type: fixture
+            brief: Module scope version of 'connect_to_sockets' fixture.
         - daemons_handler:
             type: fixture
             brief: Restarts wazuh or a specific daemon passed.
         - wait_for_authd_startup:
             type: fixture
             brief: Waits until Authd is accepting connections.
-        - connect_to_sockets:
-            type: fixture
-            brief: Module scope version of 'connect_to_sockets' fixture.
 
 
     assertions:
@@ -139,16 +141,18 @@ def test_ossec_auth_messages(test_configuration, test_metadata, set_wazuh_config
     '''
     test_case = test_metadata['stages']
     for stage in test_case:
-        # Reopen socket (socket is closed by manager after sending message with client key)
+        # Reopen socket (authd answers a single request per connection and then closes it)
         receiver_sockets[0].open()
-        expected = stage['output']
+        # Block on the first response instead of polling the socket
+        receiver_sockets[0].sock.settimeout(RESPONSE_TIMEOUT)
+        expected = stage['output'].encode()
         message = stage['input']
         receiver_sockets[0].send(message, size=False)
-        timeout = time.time() + 10
-        response = ''
-        while response == '':
-            response = receiver_sockets[0].receive().decode()
-            if time.time() > timeout:
-                assert response != '', 'The manager did not respond to the message sent.'
-        assert response[:len(expected)] == expected, \
-            'Failed test case {}: Response was: {} instead of: {}'.format(set_up_groups['name'], response, expected)
+        try:
+            response = receiver_sockets[0].receive()
+        except socket.timeout:
+            response = b''
+        assert response, 'The manager did not respond to the message sent.'
+        # Compare the raw bytes, the response is only decoded to report a failure
+        assert response.startswith(expected), \
+            f"Response was: {response.decode(errors='replace')} instead of: {stage['output']}"
@@ -134,11 +134,11 @@ def test_ossec_auth_messages_with_key_hash(test_configuration, test_metadata, se
     expected = test_metadata['output']
     message = test_metadata['input']
     receiver_sockets[0].send(message, size=False)
-    timeout = time.time() + 10
+    timeout = time.monotonic() + 10
     response = ''
     while response == '':
         response = receiver_sockets[0].receive().decode()
-        if time.time() > timeout:
+        if time.monotonic() > timeout:
             assert response != '', 'The manager did not respond to the message sent.'
     assert response[:len(expected)] == expected, \
         'Failed: Response was: {} instead of: {}' \
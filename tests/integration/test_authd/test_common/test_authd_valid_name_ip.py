@@ -132,12 +132,12 @@ def test_authd_valid_name_ip(test_configuration, test_metadata, set_wazuh_config
     # Send the message to the socket.
     receiver_sockets[0].send(test_metadata['input'], size=False)
     # Set the timeout and the empty response str.
-    timeout = time.time() + 10
+    timeout = time.monotonic() + 10
     response = ''
 
     # Wait the socket response or raise an error if timeout.
     while response == '':
-        if time.time() > timeout:
+        if time.monotonic() > timeout:
             raise ConnectionResetError('Manager did not respond to sent message!')
         response = receiver_sockets[0].receive().decode()
 
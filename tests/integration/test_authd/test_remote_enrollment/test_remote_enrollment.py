@@ -98,8 +98,8 @@ def wait_for_tcp_port(port, host='localhost', timeout=10):
         TimeoutError: The port isn't accepting connection after time specified in `timeout`.
     """
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < timeout:
         try:
             sock.connect((host, port))
             sock.close()
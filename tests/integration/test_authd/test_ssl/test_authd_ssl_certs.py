@@ -176,10 +176,10 @@ def test_authd_ssl_certs(test_configuration, test_metadata, set_wazuh_configurat
     AGENT_ID = AGENT_ID + 1
     try:
         response = ''
-        timeout = time.time() + 10
+        timeout = time.monotonic() + 10
         while response == '':
             response = SSL_socket.receive().decode()
-            if time.time() > timeout:
+            if time.monotonic() > timeout:
                 raise ConnectionResetError('Manager did not respond to sent message!')
         if option in ['INCORRECT HOST'] and verify_host:
             raise AssertionError(f'An incorrect host was able to register using the verify_host option')
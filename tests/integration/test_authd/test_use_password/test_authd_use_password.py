@@ -161,11 +161,11 @@ def test_authd_use_password(test_configuration, test_metadata, set_wazuh_configu
         message = AGENT_INPUT.format(test_metadata['user'])
 
     receiver_sockets[0].send(message, size=False)
-    timeout = time.time() + 10
+    timeout = time.monotonic() + 10
     response = ''
     while response == '':
         response = receiver_sockets[0].receive().decode()
-        if time.time() > timeout:
+        if time.monotonic() > timeout:
             raise ConnectionResetError('Manager did not respond to sent message!')
 
     # Creating output message